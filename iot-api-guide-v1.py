@@ -2,7 +2,8 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import requests
-from io import StringIO
+from plotly_resampler import FigureResampler
+from io import BytesIO
 
 # Streamlit app configuration
 st.set_page_config(page_title="IoT Data Viewer", page_icon="📊")
@@ -13,16 +14,55 @@ st.title("IoT Data Viewer")
 # GitHub raw URL for sensor_data.csv
 SENSOR_DATA_URL = "https://raw.githubusercontent.com/BurstSoftware/iot-api-guide-v1/main/sensor_data.csv"
 
+# Columns the CSV must provide
+REQUIRED_COLUMNS = frozenset(("timestamp", "temperature", "humidity"))
+
+# Maximum number of points per trace sent to the browser
+CHART_MAX_POINTS = 2000
+
+# Number of rows shown in the data table preview
+TABLE_PREVIEW_ROWS = 500
+
+# Shared HTTP session so cache-miss refetches reuse the keep-alive TLS connection
+@st.cache_resource
+def get_http_session():
+    session = requests.Session()
+    session.headers.update({"Accept-Encoding": "gzip", "User-Agent": "iot-viewer/1"})
+    return session
+
+# Validators and parsed frame from the last successful fetch, for conditional GETs
+@st.cache_resource
+def get_csv_cache():
+    return {"etag": None, "last_modified": None, "df": None}
+
 # Function to fetch and load sensor data from GitHub CSV
-@st.cache_data(ttl=300)  # Cache for 5 minutes to reduce GitHub requests
+# cache_resource returns the frame without copying; callers must treat it as read-only
+@st.cache_resource(ttl=300)  # Cache for 5 minutes to reduce GitHub requests
 def load_sensor_data():
+    csv_cache = get_csv_cache()
+    headers = {}
+    if csv_cache["df"] is not None:
+        if csv_cache["etag"]:
+            headers["If-None-Match"] = csv_cache["etag"]
+        if csv_cache["last_modified"]:
+            headers["If-Modified-Since"] = csv_cache["last_modified"]
     try:
-        response = requests.get(SENSOR_DATA_URL, timeout=5)
+        response = get_http_session().get(SENSOR_DATA_URL, headers=headers, timeout=5)
+        # Unchanged on GitHub: skip the download and re-parse
+        if response.status_code == 304:
+            return csv_cache["df"]
         response.raise_for_status()
-        csv_content = StringIO(response.text)
-        df = pd.read_csv(csv_content)
-        if not all(col in df.columns for col in ["timestamp", "temperature", "humidity"]):
+        csv_content = BytesIO(response.content)
+        df = pd.read_csv(csv_content, engine="pyarrow")
+        if not REQUIRED_COLUMNS.issubset(df.columns):
             raise ValueError("CSV must have columns: timestamp, temperature, humidity")
+        # Sensor readings don't need float64; halves memory and chart payload size
+        df = df.astype({"temperature": "float32", "humidity": "float32"})
+        df["timestamp"] = pd.to_datetime(df["timestamp"], format="%Y-%m-%d %H:%M:%S",
+                                         cache=True, errors="coerce")
+        csv_cache.update(etag=response.headers.get("ETag"),
+                         last_modified=response.headers.get("Last-Modified"),
+                         df=df)
         return df
     except requests.RequestException as e:
         st.error(f"Failed to fetch data from GitHub: {e}")
@@ -36,11 +76,20 @@ df = load_sensor_data()
 
 if not df.empty:
     st.subheader("Sensor Data")
-    st.dataframe(df)
+    st.dataframe(df.head(TABLE_PREVIEW_ROWS), use_container_width=True)
+    # Only serialize the full table when the user asks for it
+    if len(df) > TABLE_PREVIEW_ROWS:
+        if st.toggle(f"Show full table ({len(df)} rows)"):
+            st.dataframe(df, use_container_width=True)
     st.subheader("Temperature and Humidity Chart")
-    fig = px.line(df, x="timestamp", y=["temperature", "humidity"],
-                  title="Sensor Data Over Time",
-                  labels={"value": "Measurement", "variable": "Sensor Type"})
+    # Downsample each trace server-side so only CHART_MAX_POINTS reach the browser
+    fig = FigureResampler(
+        px.line(df, x="timestamp", y=["temperature", "humidity"],
+                title="Sensor Data Over Time",
+                labels={"value": "Measurement", "variable": "Sensor Type"},
+                render_mode="webgl"),
+        default_n_shown_samples=CHART_MAX_POINTS,
+    )
     st.plotly_chart(fig)
 else:
     st.warning("No data available. Check the CSV file on GitHub.")